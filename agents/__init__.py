@@ -1,9 +1,15 @@
 """Agents for Florida Retirement Resources Multi-Agent System."""
 
-from .medicare_agent import create_medicare_agent
-from .medicaid_agent import create_medicaid_agent
-from .local_resources_agent import create_local_resources_agent
-from .coordinator_agent import create_coordinator_agent
+import importlib
+
+# Factories are imported on first access, so `import agents` stays cheap and
+# only the requested agent module (and its ADK dependencies) is loaded.
+_LAZY = {
+    "create_medicare_agent": ".medicare_agent",
+    "create_medicaid_agent": ".medicaid_agent",
+    "create_local_resources_agent": ".local_resources_agent",
+    "create_coordinator_agent": ".coordinator_agent",
+}
 
 __all__ = [
     "create_medicare_agent",
@@ -13,4 +19,13 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
 
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,17 @@
+"""Shared Gemini model instances for all agents."""
+
+from functools import lru_cache
+
+from google.adk.models import Gemini
+
+
+@lru_cache(maxsize=None)
+def shared_gemini(model: str) -> Gemini:
+    """Return the process-wide Gemini wrapper for `model`.
+
+    ADK creates a google-genai client, with its own HTTP connection pool, per
+    Gemini instance. Giving every agent on the same model the same instance
+    lets the coordinator and specialists reuse one client and its keep-alive
+    connections instead of each opening their own.
+    """
+    return Gemini(model=model)
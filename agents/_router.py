@@ -0,0 +1,51 @@
+"""Cheap pre-routing of user queries before the full coordinator.
+
+Short, impersonal questions about a single domain ("What is Medicare Part B?")
+can be answered by that domain's specialist directly, skipping the
+coordinator's extra model turn and specialist fan-out. Anything personal,
+comparative, or spanning several domains still goes to the coordinator, which
+handles intake and synthesis.
+"""
+
+import re
+from functools import lru_cache
+from typing import Literal
+
+Route = Literal["medicare", "medicaid", "local_resources", "coordinator"]
+
+_DOMAIN_PATTERNS = {
+    "medicare": re.compile(r"\b(medicare|part [abcd]|medigap)\b", re.IGNORECASE),
+    "medicaid": re.compile(
+        r"\b(medicaid|long[- ]term care|nursing homes?|waiver programs?)\b", re.IGNORECASE
+    ),
+    "local_resources": re.compile(
+        r"\b(senior cent(?:er|re)s?|housing|transportation|hospitals?|clinics?)\b",
+        re.IGNORECASE,
+    ),
+}
+
+# Comparisons need more than one specialist's view
+_MULTI_INTENT = re.compile(r"\b(difference|differences|compare|comparing|versus|vs\.?)\b", re.IGNORECASE)
+
+# Personal details (pronouns, ages, amounts) call for the coordinator's intake
+_PERSONAL_CONTEXT = re.compile(r"\b(i|i'm|im|my|me|we|our|us)\b|\d", re.IGNORECASE)
+
+MAX_DIRECT_WORDS = 25
+
+
+@lru_cache(maxsize=1024)
+def route(query: str) -> Route:
+    """Return the specialist that can answer `query` alone, or "coordinator".
+
+    Verdicts are cached per query string, so repeated questions are routed
+    without re-running the patterns.
+    """
+    if len(query.split()) > MAX_DIRECT_WORDS:
+        return "coordinator"
+    if _MULTI_INTENT.search(query) or _PERSONAL_CONTEXT.search(query):
+        return "coordinator"
+
+    domains = [name for name, pattern in _DOMAIN_PATTERNS.items() if pattern.search(query)]
+    if len(domains) == 1:
+        return domains[0]
+    return "coordinator"
@@ -0,0 +1,143 @@
+"""In-memory response cache for repeated or near-duplicate user questions.
+
+Lookups go through two layers:
+- An exact layer keyed by the SHA-256 of the normalized query text
+- A semantic layer that compares query embeddings by cosine similarity
+
+Entries are evicted least-recently-used first and expire after a TTL.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Async callable that returns an embedding vector for a piece of text.
+Embedder = Callable[[str], Awaitable[Sequence[float]]]
+
+
+@dataclass
+class _Entry:
+    reply: str
+    expires_at: float
+    embedding: Optional[np.ndarray]
+
+
+def _query_key(query: str) -> str:
+    """Hash the query after collapsing case and whitespace."""
+    normalized = " ".join(query.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class SemanticCache:
+    """LRU + TTL cache that returns stored replies for similar questions.
+
+    Only use this in front of agents with low sampling temperature; otherwise
+    a cached reply is not representative of what the agent would say.
+    """
+
+    def __init__(
+        self,
+        embed: Optional[Embedder] = None,
+        threshold: float = 0.92,
+        max_entries: int = 256,
+        ttl_seconds: float = 3600.0,
+    ) -> None:
+        self._embed = embed
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # Embeddings computed by a missed `get`, reused by the following `put`
+        self._pending: Dict[str, np.ndarray] = {}
+        # Stacked unit-norm embeddings of live entries, rebuilt lazily on change
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_keys: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, query: str) -> Optional[str]:
+        """Return a cached reply for `query` (or a near-duplicate), if any."""
+        self._evict_expired()
+        key = _query_key(query)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry.reply
+
+        embedding = await self._embedding(query)
+        if embedding is None:
+            return None
+        self._pending[key] = embedding
+
+        matrix = self._stacked()
+        if matrix is None:
+            return None
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < self._threshold:
+            return None
+
+        match_key = self._matrix_keys[best]
+        self._entries.move_to_end(match_key)
+        return self._entries[match_key].reply
+
+    async def put(self, query: str, reply: str) -> None:
+        """Store `reply` as the answer for `query`."""
+        key = _query_key(query)
+        embedding = self._pending.pop(key, None)
+        if embedding is None:
+            embedding = await self._embedding(query)
+
+        self._entries[key] = _Entry(
+            reply=reply,
+            expires_at=time.monotonic() + self._ttl_seconds,
+            embedding=embedding,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self._matrix = None
+
+    async def _embedding(self, query: str) -> Optional[np.ndarray]:
+        """Embed and L2-normalize `query`; None if embeddings are unavailable."""
+        if self._embed is None:
+            return None
+        try:
+            vector = np.asarray(await self._embed(query), dtype=np.float32)
+        except Exception as exc:  # pragma: no cover - network/backend errors
+            # The exact-match layer still works without embeddings.
+            print(f"[CACHE] embedding failed, using exact matches only: {exc}")
+            return None
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def _stacked(self) -> Optional[np.ndarray]:
+        """Return live embeddings as one (entries x dims) matrix."""
+        if self._matrix is None:
+            self._matrix_keys = [
+                key for key, entry in self._entries.items() if entry.embedding is not None
+            ]
+            if self._matrix_keys:
+                self._matrix = np.stack(
+                    [self._entries[key].embedding for key in self._matrix_keys]
+                )
+        return self._matrix
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        if expired:
+            self._matrix = None
+        # Drop embeddings from lookups that were never followed by a `put`
+        if len(self._pending) > self._max_entries:
+            self._pending.clear()
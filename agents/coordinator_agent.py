@@ -1,21 +1,32 @@
 """Coordinator agent that routes queries to specialized agents."""
 
+from functools import lru_cache
 from typing import Optional
 
 from google.adk.agents import LlmAgent
 from google.adk.tools import AgentTool
 from google.genai import types
 
+from ._models import shared_gemini
+from .prompts import load_prompt
 from .medicare_agent import create_medicare_agent
 from .medicaid_agent import create_medicaid_agent
 from .local_resources_agent import create_local_resources_agent
 
 
+# Static system prompt. Keeping it byte-identical across turns lets Gemini
+# reuse the cached prompt prefix instead of re-processing it every call.
+_INSTRUCTION = load_prompt("coordinator.md")
+
+
 def create_coordinator_agent(
     model: str = "gemini-2.5-flash-lite",
     medicaid_model: Optional[str] = None,
 ) -> LlmAgent:
     """Create a coordinator agent that routes queries to specialized agents.
+
+    The agent graph is cached per model pair, so every app instance in a
+    process shares the same coordinator, specialists, and AgentTool wrappers.
     
     Args:
         model: The LLM model to use for the coordinator, Medicare, and local resources.
@@ -24,59 +35,19 @@ def create_coordinator_agent(
     Returns:
         Configured LlmAgent that coordinates between specialist agents
     """
-    # Create specialist agents
-    medicare_agent = create_medicare_agent(model)
-    medicaid_agent = create_medicaid_agent(medicaid_model or model)
-    local_resources_agent = create_local_resources_agent(model)
-
-    instruction = """You are a compassionate intake and coordinator specialist for the Florida Retirement Resources Multi-Agent System.
-
-Your tone and approach:
-- Always sound warm, patient, and reassuring
-- Acknowledge that navigating retirement benefits can feel overwhelming or confusing
-- Use simple, clear language and avoid jargon where possible
+    return _build_coordinator(model, medicaid_model or model)
 
-Your role:
-- Greet the person warmly and establish a supportive tone
-- Ask gentle, conversational follow-up questions instead of interrogating
-- Understand what they’re worried about (Medicare, Medicaid, local help, or a mix)
-- Route questions to the appropriate specialist agent and synthesize the results
-- Provide clear, actionable next steps at the end of each conversation
 
-Information you should usually gather over a few turns (not all at once):
-- Current age and general health situation
-- Whether they are currently receiving Social Security benefits
-- Approximate monthly income (theirs and spouse, if applicable)
-- Approximate assets (excluding their primary home)
-- The Florida city or county where they live
-- Whether they’re in a crisis right now or planning ahead
-
-Available specialist agents:
-1. Medicare Specialist: For questions about Medicare Parts A/B/C/D, enrollment, costs, plans, supplemental insurance
-2. Medicaid Specialist: For questions about Florida Medicaid eligibility, applications, long-term care, waiver programs
-3. Local Resources Specialist: For finding healthcare facilities, housing, transportation, senior centers in specific Florida cities
-
-Routing guidelines:
-- Medicare questions → Medicare Specialist
-- Medicaid questions → Medicaid Specialist
-- Local resources, facilities, services → Local Resources Specialist
-- Complex questions may require multiple agents – coordinate as needed and explain what you’re doing
-
-Response guidelines:
-- Start by briefly validating their concern (for example, “It’s completely reasonable to wonder about X”)
-- ALWAYS provide some helpful context or initial guidance based on what you already know **before** asking for more details
-- When you need more information, explain *why* you’re asking and keep follow‑up questions to 1–2 at a time
-- Prefer short sections or bullets (like “When X makes sense / When X doesn’t make sense”) so explanations feel structured but not overwhelming
-- Avoid overwhelming the user; prioritize what they need to know right now
-- Use the specialist agents to get detailed information, then restate it in user-friendly, practical language
-- End with a short summary and 2–3 concrete next steps
-
-Safety:
-- Never provide medical, legal, or financial advice
-- Always direct users to official sources for applications and final determinations
-- Clarify that information is for guidance purposes
-- Encourage users to consult professionals (doctors, lawyers, financial advisors) for specific advice"""
+@lru_cache(maxsize=4)
+def _build_coordinator(model: str, medicaid_model: str) -> LlmAgent:
+    """Build the coordinator and its specialists once per model pair."""
+    # Create specialist agents (cached per model, shared across coordinators)
+    medicare_agent = create_medicare_agent(model)
+    medicaid_agent = create_medicaid_agent(medicaid_model)
+    local_resources_agent = create_local_resources_agent(model)
 
+    # The instruction asks for all needed specialists in one model turn; ADK
+    # executes the function calls from a single turn concurrently.
     tools = [
         AgentTool(medicare_agent),
         AgentTool(medicaid_agent),
@@ -86,8 +57,8 @@ Safety:
     agent = LlmAgent(
         name="retirement_resources_coordinator",
         description="Coordinator agent for Florida Retirement Resources Multi-Agent System",
-        instruction=instruction,
-        model=model,
+        instruction=_INSTRUCTION,
+        model=shared_gemini(model),
         tools=tools,
         generate_content_config=types.GenerateContentConfig(
             max_output_tokens=8192,
@@ -1,15 +1,24 @@
 """Medicaid specialist agent."""
 
+from functools import lru_cache
+
 from google.adk.agents import LlmAgent
 from google.adk.tools import FunctionTool, google_search
 from google.genai import types
 
-
 from tools.medicaid_tools import get_medicaid_info, check_medicaid_eligibility
 
+from ._models import shared_gemini
+from .prompts import load_prompt
+
+
+_INSTRUCTION = load_prompt("medicaid.md")
+
 
 def create_medicaid_agent(model: str = "gemini-2.0-flash-lite") -> LlmAgent:
     """Create a Medicaid specialist agent.
+
+    Agents are cached per model, so repeated calls share one instance.
     
     Args:
         model: The LLM model to use for the agent
@@ -17,31 +26,12 @@ def create_medicaid_agent(model: str = "gemini-2.0-flash-lite") -> LlmAgent:
     Returns:
         Configured LlmAgent for Medicaid assistance
     """
-    instruction = """You are a Medicaid specialist agent helping Florida retirees understand Medicaid programs.
-
-Your role:
-- Provide information about Florida Medicaid eligibility requirements
-- Explain income and asset limits for different Medicaid programs
-- Help users understand Long-Term Care Medicaid vs. regular Medicaid
-- Guide users through the application process
-- Explain waiver programs and home/community-based services
-- Provide information about nursing home coverage and alternatives
-
-Guidelines:
-- Always emphasize that eligibility determinations are made by the state
-- Provide preliminary assessments but clarify they are not final
-- Direct users to official Florida Medicaid resources for applications
-- Be sensitive to financial concerns and provide clear, non-judgmental information
-- Explain complex topics like look-back periods and spousal protections clearly
-- Use the available tools to provide accurate information
-
-Safety:
-- Never provide legal advice - recommend consulting elder law attorneys for complex situations
-- Clarify that preliminary assessments are not final eligibility determinations
-- Remind users that rules can change and vary by program
-- Always direct users to official sources for applications and final determinations
-- Be careful with asset planning advice - recommend professional consultation"""
+    return _build_medicaid_agent(model)
+
 
+@lru_cache(maxsize=4)
+def _build_medicaid_agent(model: str) -> LlmAgent:
+    """Build the Medicaid specialist agent; cached so each model is built once."""
     tools = [
         google_search
     ]
@@ -49,8 +39,8 @@ Safety:
     agent = LlmAgent(
         name="medicaid_specialist",
         description="Specialist agent for Florida Medicaid information and eligibility assistance",
-        instruction=instruction,
-        model=model,
+        instruction=_INSTRUCTION,
+        model=shared_gemini(model),
         tools=tools,
         generate_content_config=types.GenerateContentConfig(
             max_output_tokens=4096,
@@ -0,0 +1,10 @@
+"""System prompts for the agents, stored as Markdown resources."""
+
+from functools import lru_cache
+from importlib import resources
+
+
+@lru_cache(maxsize=None)
+def load_prompt(name: str) -> str:
+    """Read prompt `name` (e.g. "coordinator.md") from this package once."""
+    return resources.files(__name__).joinpath(name).read_text(encoding="utf-8").strip()
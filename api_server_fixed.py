@@ -4,12 +4,23 @@ Run with:
 
     uvicorn api_server_fixed:app --reload --port 8000
 
-Then point the Expo frontend to http://localhost:8000/chat
+uvicorn runs on uvloop automatically when it is installed (it ships with
+`uvicorn[standard]`), so no event-loop setup is needed here.
+
+Then point the Expo frontend to http://localhost:8000/chat (or
+http://localhost:8000/chat/stream for Server-Sent Events)
 """
 
+import json
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from main import RetirementResourcesApp
 
@@ -22,16 +33,48 @@ class ChatResponse(BaseModel):
     reply: str
 
 
+class OriginGatedCORSMiddleware:
+    """Run CORS handling only for requests that carry an `Origin` header.
+
+    Same-origin, server-to-server, and health-check requests have no Origin
+    header and don't need CORS response headers, so they skip it entirely.
+    """
+
+    def __init__(self, app: ASGIApp, **cors_options) -> None:
+        self.app = app
+        self.cors = CORSMiddleware(app, **cors_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and any(name == b"origin" for name, _ in scope["headers"]):
+            await self.cors(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+# Comma-separated list of allowed origins; "*" keeps local development open
+CORS_ALLOW_ORIGINS = [
+    origin.strip() for origin in os.environ.get("CORS_ALLOW_ORIGINS", "*").split(",")
+]
+
+
 # Create a single, long-lived instance of the retirement assistant
 retirement_app = RetirementResourcesApp()
 
 
-app = FastAPI(title="Retirement Resources Assistant API")
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Warm up the assistant before serving, so the first user request doesn't
+    pay for session setup (set RETIREMENT_PRIME_MODEL=1 to also prime the model)."""
+    await retirement_app.warm_up()
+    yield
+
+
+app = FastAPI(title="Retirement Resources Assistant API", lifespan=lifespan)
 
 # Allow local development from the Expo web app
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # For dev; tighten this in production
+    OriginGatedCORSMiddleware,
+    allow_origins=CORS_ALLOW_ORIGINS,  # For dev; set CORS_ALLOW_ORIGINS in production
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -50,3 +93,19 @@ async def chat(request: ChatRequest) -> ChatResponse:
     return ChatResponse(reply=reply)
 
 
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """Stream the reply as Server-Sent Events.
+
+    Each event is `data: {"delta": "<text>"}`; the stream ends with
+    `data: {"done": true}`.
+    """
+
+    async def events() -> AsyncIterator[str]:
+        async for chunk in retirement_app.chat_stream(request.message):
+            yield f"data: {json.dumps({'delta': chunk})}\n\n"
+        yield f"data: {json.dumps({'done': True})}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
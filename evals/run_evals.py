@@ -2,23 +2,35 @@
 
 This script:
 - Loads test cases from evals/health_review/multi_domain_v1.jsonl
-- Runs each input through the coordinator via RetirementResourcesApp
+- Runs each input through RetirementResourcesApp (the coordinator, or a
+  single specialist for simple questions), several cases at a time
 - Applies cheap automatic checks (safety/content heuristics)
 - Prints a compact summary and exits non-zero if there are hard failures
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
-from main import RetirementResourcesApp
+from main import RetirementResourcesApp, run_async
 
 
 EVAL_FILE = Path(__file__).parent / "health_review" / "multi_domain_v1.jsonl"
+# Maximum number of cases in flight against the Gemini API at once
+DEFAULT_CONCURRENCY = int(os.environ.get("EVAL_CONCURRENCY", "5"))
+
+# From this many banned phrases up, scan the response once with a combined
+# pattern instead of once per phrase
+MULTI_PATTERN_MIN_SNIPPETS = 4
+
+MEDICARE_RE = re.compile(r"\bmedicare\b", re.IGNORECASE)
+MEDICAID_RE = re.compile(r"\bmedicaid\b", re.IGNORECASE)
 
 
 @dataclass
@@ -27,42 +39,63 @@ class EvalCase:
     input: str
     intent_type: str
     expected_domains: List[str]
-    must_contain: List[str]
-    must_not_contain: List[str]
+    # Snippets are lower-cased once at load time
+    must_contain: Tuple[str, ...]
+    must_not_contain: Tuple[str, ...]
     raw: Dict[str, Any]
+    # Word-boundary match for the profile city (multi_domain cases only)
+    city_re: Optional[Pattern[str]] = None
+    # Single-pass matcher over all must_not_contain snippets (large lists only)
+    banned_re: Optional[Pattern[str]] = None
+
+
+def _to_case(data: Dict[str, Any]) -> EvalCase:
+    intent_type = data.get("intent_type", "unknown")
+    city = data.get("profile_hints", {}).get("city")
+    city_re = None
+    if intent_type == "multi_domain" and city:
+        city_re = re.compile(rf"\b{re.escape(str(city))}\b", re.IGNORECASE)
+    must_not_contain = tuple(s.lower() for s in data.get("must_not_contain", []))
+    banned_re = None
+    if len(must_not_contain) >= MULTI_PATTERN_MIN_SNIPPETS:
+        banned_re = re.compile("|".join(re.escape(s) for s in must_not_contain))
+    return EvalCase(
+        id=data["id"],
+        input=data["input"],
+        intent_type=intent_type,
+        expected_domains=data.get("expected_domains", []),
+        must_contain=tuple(s.lower() for s in data.get("must_contain", [])),
+        must_not_contain=must_not_contain,
+        raw=data,
+        city_re=city_re,
+        banned_re=banned_re,
+    )
 
 
 def load_cases(path: Path) -> List[EvalCase]:
-    cases: List[EvalCase] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            data = json.loads(line)
-            cases.append(
-                EvalCase(
-                    id=data["id"],
-                    input=data["input"],
-                    intent_type=data.get("intent_type", "unknown"),
-                    expected_domains=data.get("expected_domains", []),
-                    must_contain=data.get("must_contain", []),
-                    must_not_contain=data.get("must_not_contain", []),
-                    raw=data,
-                )
-            )
-    return cases
+    # One read for the whole file; json.loads accepts UTF-8 bytes directly
+    data = path.read_bytes()
+    return [_to_case(json.loads(line)) for line in data.splitlines() if line.strip()]
 
 
-def text_contains_all(text: str, snippets: List[str]) -> bool:
-    return all(snippet.lower() in text.lower() for snippet in snippets)
+def text_contains_all(text_lower: str, snippets: Tuple[str, ...]) -> bool:
+    """Check pre-lowered `text_lower` for every (already lower-case) snippet."""
+    return all(snippet in text_lower for snippet in snippets)
 
 
-def text_contains_any(text: str, snippets: List[str]) -> bool:
-    return any(snippet.lower() in text.lower() for snippet in snippets)
+def text_contains_any(text_lower: str, snippets: Tuple[str, ...]) -> bool:
+    """Check pre-lowered `text_lower` for any (already lower-case) snippet."""
+    return any(snippet in text_lower for snippet in snippets)
 
 
-def run_evals() -> int:
+def contains_banned(case: EvalCase, text_lower: str) -> bool:
+    """Check pre-lowered `text_lower` for any of the case's banned phrases."""
+    if case.banned_re is not None:
+        return case.banned_re.search(text_lower) is not None
+    return text_contains_any(text_lower, case.must_not_contain)
+
+
+async def arun_evals(concurrency: int = DEFAULT_CONCURRENCY) -> int:
     if not EVAL_FILE.exists():
         raise FileNotFoundError(f"Eval file not found: {EVAL_FILE}")
 
@@ -74,22 +107,44 @@ def run_evals() -> int:
     soft_warnings: List[str] = []
 
     print(f"Loaded {total} evaluation cases from {EVAL_FILE}")
-
-    for case in cases:
+    print(f"Running with concurrency={concurrency}")
+
+    # Cases are independent, so run them concurrently (bounded to stay within
+    # API rate limits), each in its own session, then report in input order.
+    # Sessions are created in one batch up front so workers start warm; they
+    # are not shared so no case sees another case's conversation history.
+    session_ids = {case.id: f"eval_{case.id}" for case in cases}
+    await app.create_sessions(session_ids.values())
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run_one(case: EvalCase) -> Tuple[Optional[str], Optional[Exception]]:
+        # A failed case (e.g. a rate-limit error) must not abort the others
+        async with semaphore:
+            try:
+                return await app.chat_async(case.input, session_id=session_ids[case.id]), None
+            except Exception as exc:
+                return None, exc
+
+    results = await asyncio.gather(*[_run_one(case) for case in cases])
+
+    for case, (response, error) in zip(cases, results):
         print(f"\n=== Case {case.id} ===")
         print(f"Input: {case.input}")
-
-        response = app.chat(case.input, session_id=f"eval_{case.id}")
+        if error is not None:
+            print(f"[FAIL] Error while running case: {type(error).__name__}: {error}")
+            hard_failures.append(case.id)
+            continue
         print(f"Response:\n{response}\n")
+        response_lower = response.lower()
 
         # Hard checks: must_contain / must_not_contain
         failed = False
-        if case.must_contain and not text_contains_all(response, case.must_contain):
+        if case.must_contain and not text_contains_all(response_lower, case.must_contain):
             print(f"[FAIL] Missing one or more required phrases in response.")
             hard_failures.append(case.id)
             failed = True
 
-        if case.must_not_contain and text_contains_any(response, case.must_not_contain):
+        if case.must_not_contain and contains_banned(case, response_lower):
             print(f"[FAIL] Response contains banned phrase.")
             if case.id not in hard_failures:
                 hard_failures.append(case.id)
@@ -98,13 +153,10 @@ def run_evals() -> int:
         # Soft heuristic: for multi_domain, ensure at least two key terms appear
         if case.intent_type == "multi_domain":
             # Simple heuristic keywords for domains
-            medicare_present = bool(re.search(r"\bmedicare\b", response, re.IGNORECASE))
-            medicaid_present = bool(re.search(r"\bmedicaid\b", response, re.IGNORECASE))
+            medicare_present = bool(MEDICARE_RE.search(response))
+            medicaid_present = bool(MEDICAID_RE.search(response))
             city_hint = case.raw.get("profile_hints", {}).get("city")
-            city_present = bool(
-                city_hint
-                and re.search(rf"\b{re.escape(str(city_hint))}\b", response, re.IGNORECASE)
-            )
+            city_present = bool(case.city_re and case.city_re.search(response))
             if not (medicare_present and medicaid_present and city_present):
                 msg = (
                     f"[WARN] multi_domain case '{case.id}' did not obviously mention "
@@ -127,6 +179,11 @@ def run_evals() -> int:
     return 1 if hard_failures else 0
 
 
+def run_evals() -> int:
+    """Synchronous entry point around `arun_evals`."""
+    return run_async(arun_evals())
+
+
 if __name__ == "__main__":
     raise SystemExit(run_evals())
 
@@ -1,19 +1,21 @@
 """Example usage of the Florida Retirement Resources Multi-Agent System."""
 
-from main import RetirementResourcesApp
+import asyncio
 
+from main import RetirementResourcesApp, run_async
 
-def example_queries():
+
+async def example_queries_async():
     """Run example queries to demonstrate the system."""
-    
+
     print("=" * 70)
     print("Florida Retirement Resources - Example Queries")
     print("=" * 70)
     print()
-    
+
     # Initialize the application
     app = RetirementResourcesApp()
-    
+
     # Example queries
     examples = [
         "What is Medicare Part B and how much does it cost?",
@@ -22,24 +24,29 @@ def example_queries():
         "I need help finding a senior center in Orlando",
         "Can you help me understand the difference between Medicare and Medicaid?",
     ]
-    
-    for i, query in enumerate(examples, 1):
+
+    # The examples are independent, so send them all at once (each in its own
+    # session) and print the answers in order once they are back.
+    tasks = [
+        app.chat_async(query, session_id=f"example_{i}")
+        for i, query in enumerate(examples, 1)
+    ]
+    responses = await asyncio.gather(*tasks)
+
+    for (i, query), response in zip(enumerate(examples, 1), responses):
         print(f"\n{'='*70}")
         print(f"Example {i}: {query}")
         print('='*70)
         print()
-        
-        response = app.chat(query)
+
         print(f"Response:\n{response}\n")
         print("-" * 70)
-        
-        # Small delay for readability
-        import time
-        time.sleep(1)
-
 
-if __name__ == "__main__":
-    example_queries()
 
+def example_queries():
+    """Synchronous entry point around `example_queries_async`."""
+    run_async(example_queries_async())
 
 
+if __name__ == "__main__":
+    example_queries()
@@ -13,20 +13,39 @@ It exposes:
 
 import os
 import asyncio
-from typing import Optional
-
+import atexit
+import threading
+from contextlib import aclosing
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, Optional, Set, Tuple
+
+from google import genai
+from google.adk.agents import LlmAgent, RunConfig
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.agents.run_config import StreamingMode
+from google.adk.apps import App
+from google.adk.events import Event
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import BaseSessionService, InMemorySessionService
+from google.adk.sessions.sqlite_session_service import SqliteSessionService
 from google.genai import types
 
-from agents import create_coordinator_agent
+from agents import (
+    create_coordinator_agent,
+    create_local_resources_agent,
+    create_medicaid_agent,
+    create_medicare_agent,
+)
+from agents._router import Route, route
+
+if TYPE_CHECKING:
+    # Imported on demand in RetirementResourcesApp; it pulls in NumPy
+    from agents._semantic_cache import SemanticCache
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-# Configure API Key (falls back to placeholder if not set)
-os.environ["GOOGLE_API_KEY"] = os.environ.get("GOOGLE_API_KEY", "YOUR_GOOGLE_API_KEY")
 os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "False"  # Use API directly, not Vertex AI
 
 # Application/session defaults
@@ -39,11 +58,44 @@ APP_NAME = "agents"
 DEFAULT_MODEL = "gemini-2.5-flash-lite"
 DEFAULT_USER_ID = "user_001"
 DEFAULT_SESSION_ID = "retirement_session_001"
+# Agent instructions are static module-level prompts, so the request prefix is
+# stable across turns and can be served from Gemini's context cache.
+CONTEXT_CACHE_TTL_SECONDS = 3600
+# Set to a SQLite file path to persist sessions across runs (evals/tests only)
+SESSION_DB_ENV = "RETIREMENT_SESSION_DB"
+# Set to 1/true to send one throwaway model call at startup (see `warm_up`)
+PRIME_MODEL_ENV = "RETIREMENT_PRIME_MODEL"
+# Set to 0/false to send every question through the coordinator (see `_router`)
+ROUTE_SIMPLE_QUERIES_ENV = "RETIREMENT_ROUTE_SIMPLE_QUERIES"
+WARMUP_SESSION_ID = "warmup_session"
+WARMUP_MESSAGE = "Hello"
+# Response caching is only meaningful for near-deterministic agents.
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+EMBEDDING_MODEL = "gemini-embedding-001"
+NO_FINAL_RESPONSE_TEXT = "Agent did not produce a final response."
+
+
+@lru_cache(maxsize=1)
+def _resolved_api_key() -> str:
+    """Read GOOGLE_API_KEY once per process; raise if it is not configured.
+
+    Failures are not cached, so setting the key later in the process works.
+    """
+    api_key = os.environ.get("GOOGLE_API_KEY", "").strip()
+    if not api_key or api_key == "YOUR_GOOGLE_API_KEY":
+        raise RuntimeError(
+            "GOOGLE_API_KEY is not set. Get a key from "
+            "https://aistudio.google.com/app/apikey and then run:\n"
+            "  export GOOGLE_API_KEY='your-actual-key'\n"
+        )
+    return api_key
 
 
 def _warn_if_missing_api_key() -> None:
     """Print a helpful warning if the API key is not configured."""
-    if os.environ.get("GOOGLE_API_KEY") == "YOUR_GOOGLE_API_KEY":
+    try:
+        _resolved_api_key()
+    except RuntimeError:
         print("⚠️ WARNING: Please set your GOOGLE_API_KEY!")
         print("Get your key from: https://aistudio.google.com/app/apikey")
         print("Then run: export GOOGLE_API_KEY='your-actual-key'\n")
@@ -51,12 +103,86 @@ def _warn_if_missing_api_key() -> None:
 
 def _ensure_api_key() -> None:
     """Fail fast if the API key is missing."""
-    if os.environ.get("GOOGLE_API_KEY") == "YOUR_GOOGLE_API_KEY":
-        raise RuntimeError(
-            "GOOGLE_API_KEY is not set. Get a key from "
-            "https://aistudio.google.com/app/apikey and then run:\n"
-            "  export GOOGLE_API_KEY='your-actual-key'\n"
-        )
+    _resolved_api_key()
+
+
+def _create_session_service() -> BaseSessionService:
+    """Return the session service for this process.
+
+    Sessions live in memory by default. When `RETIREMENT_SESSION_DB` is set,
+    they are stored in that SQLite file instead, so re-running evals resumes
+    earlier conversations. Leave it unset for the API server: every HTTP user
+    shares the default session, and persisting it would leak history between
+    users across restarts.
+    """
+    db_path = os.environ.get(SESSION_DB_ENV)
+    if db_path:
+        db_path = os.path.expanduser(db_path)
+        # SQLite creates the file but not its parent directories
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        return SqliteSessionService(db_path)
+    return InMemorySessionService()
+
+
+def _gemini_embedder(model: str = EMBEDDING_MODEL):
+    """Return an async embedder backed by the Gemini embeddings API."""
+    client = genai.Client()
+
+    async def embed(text: str):
+        result = await client.aio.models.embed_content(model=model, contents=text)
+        return result.embeddings[0].values
+
+    return embed
+
+
+def _log_tool_calls(event) -> None:
+    """Print tool invocations carried by an ADK event."""
+    # NOTE: This is ONLY for debug/observability so we can see when tools
+    # (for example, the Medicaid agent's `google_search` tool) are actually
+    # being called during a conversation.
+    tool_calls = getattr(event, "tool_calls", None)
+    if not tool_calls:
+        return
+    try:
+        for call in tool_calls:
+            # Most ADK tool call objects expose `tool_name` and `args`
+            tool_name = getattr(call, "tool_name", "unknown_tool")
+            args = getattr(call, "args", {})
+            print(f"[TOOL] {tool_name} called with args: {args}")
+    except Exception:
+        # Defensive: if the structure is different, at least log something.
+        print(f"[TOOL] tool call event: {tool_calls}")
+
+
+def _final_reply(event: Event) -> Tuple[str, bool]:
+    """Return the reply text for a final-response event, and whether it is a real answer.
+
+    Escalations and empty final events produce a status message instead,
+    which must not be cached as an answer.
+    """
+    if event.content and event.content.parts:
+        return event.content.parts[0].text, True
+    if event.actions and event.actions.escalate:
+        return f"Agent escalated: {event.error_message or 'No specific message.'}", False
+    return NO_FINAL_RESPONSE_TEXT, False
+
+
+def run_async(coro):
+    """Run `coro` to completion on a fresh event loop, using uvloop if available."""
+    try:
+        import uvloop
+    except ImportError:  # uvloop is POSIX-only; fall back to asyncio on Windows
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop if available."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
 
 
 # ============================================================================
@@ -69,10 +195,19 @@ class RetirementResourcesApp:
 
     This is the main entry point for programmatic use. It:
     - Creates a coordinator agent (which talks to specialist agents)
-    - Manages an in-memory session
-    - Provides simple `chat` / `chat_async` methods
+    - Manages a session (in memory, or SQLite-backed for eval replays)
+    - Provides simple `chat` / `chat_async` methods, plus `chat_stream`
+    - Sends simple single-domain questions straight to that specialist,
+      unless `route_simple_queries` (or RETIREMENT_ROUTE_SIMPLE_QUERIES) is off
+    - Optionally answers repeated questions from a semantic response cache
     """
 
+    # Background event loop behind `chat`, shared by all instances and
+    # started on the first call.
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_thread: Optional[threading.Thread] = None
+    _loop_lock = threading.Lock()
+
     def __init__(
         self,
         model: str = DEFAULT_MODEL,
@@ -80,6 +215,8 @@ class RetirementResourcesApp:
         user_id: str = DEFAULT_USER_ID,
         session_id: Optional[str] = None,
         medicaid_model: Optional[str] = None,
+        cache_responses: bool = False,
+        route_simple_queries: Optional[bool] = None,
     ) -> None:
         _ensure_api_key()
 
@@ -88,74 +225,245 @@ class RetirementResourcesApp:
         self.session_id = session_id or DEFAULT_SESSION_ID
 
         # Core ADK components
-        self.session_service = InMemorySessionService()
+        self.session_service = _create_session_service()
         # Coordinator plus specialist agents. Medicaid can use its own model override
-        # (for example, a tools-capable or cheaper model) if desired.
+        # (for example, a tools-capable or cheaper model) if desired. The agent
+        # graph is cached per model, so additional app instances reuse it.
         self.agent = create_coordinator_agent(
             model=model,
             medicaid_model=medicaid_model,
         )
-        self.runner = Runner(
-            agent=self.agent,
-            app_name=self.app_name,
+        self.runner = self._make_runner(self.agent)
+        self._created_sessions: Set[str] = set()
+
+        # Simple single-domain questions skip the coordinator; the specialists
+        # are the same cached instances the coordinator delegates to.
+        if route_simple_queries is None:
+            route_simple_queries = os.environ.get(ROUTE_SIMPLE_QUERIES_ENV, "").lower() not in (
+                "0", "false", "no",
+            )
+        self.route_simple_queries = route_simple_queries
+        self._specialist_runners: Dict[Route, Runner] = {}
+        if route_simple_queries:
+            self._specialist_runners = {
+                "medicare": self._make_runner(create_medicare_agent(model)),
+                "medicaid": self._make_runner(create_medicaid_agent(medicaid_model or model)),
+                "local_resources": self._make_runner(create_local_resources_agent(model)),
+            }
+
+        # Replies are cached by question only (not conversation history), so this
+        # is opt-in and meant for independent, single-turn questions. Only agents
+        # with low sampling temperature take part, whichever one a query routes to.
+        self.response_cache: Optional["SemanticCache"] = None
+        self._cached_runners: Set[Runner] = set()
+        if cache_responses:
+            self._cached_runners = {
+                runner
+                for runner in (self.runner, *self._specialist_runners.values())
+                if runner.agent.generate_content_config.temperature
+                <= RESPONSE_CACHE_MAX_TEMPERATURE
+            }
+            if self._cached_runners:
+                from agents._semantic_cache import SemanticCache
+
+                self.response_cache = SemanticCache(embed=_gemini_embedder())
+
+    def _make_runner(self, agent: LlmAgent) -> Runner:
+        """Build a runner for `agent` over the shared session service."""
+        return Runner(
+            app=App(
+                name=self.app_name,
+                root_agent=agent,
+                context_cache_config=ContextCacheConfig(
+                    ttl_seconds=CONTEXT_CACHE_TTL_SECONDS,
+                ),
+            ),
             session_service=self.session_service,
         )
-        self._session_created = False
 
-    async def _create_session(self) -> None:
-        """Create an ADK session once per app instance."""
-        if self._session_created:
+    def _runner_for(self, query: str) -> Runner:
+        """Pick the specialist runner for simple queries, else the coordinator."""
+        if not self.route_simple_queries:
+            return self.runner
+        return self._specialist_runners.get(route(query), self.runner)
+
+    async def _create_session(self, session_id: Optional[str] = None) -> None:
+        """Create an ADK session once per session id."""
+        session_id = session_id or self.session_id
+        if session_id in self._created_sessions:
             return
-        await self.session_service.create_session(
-            app_name=self.app_name,
-            user_id=self.user_id,
-            session_id=self.session_id,
-        )
-        self._session_created = True
+        # Mark before awaiting so concurrent turns don't create it twice
+        self._created_sessions.add(session_id)
+        try:
+            # A persistent session service may already hold this session
+            existing = await self.session_service.get_session(
+                app_name=self.app_name,
+                user_id=self.user_id,
+                session_id=session_id,
+            )
+            if existing is None:
+                await self.session_service.create_session(
+                    app_name=self.app_name,
+                    user_id=self.user_id,
+                    session_id=session_id,
+                )
+        except Exception:
+            self._created_sessions.discard(session_id)
+            raise
+
+    async def warm_up(self, prime_model: Optional[bool] = None) -> None:
+        """Do first-request setup ahead of time.
+
+        Always creates the default session. With `prime_model` (defaults to the
+        RETIREMENT_PRIME_MODEL env var), also sends one short message in a
+        separate throwaway session, so the model client and its connections are
+        ready before the first real request. That costs one model call and
+        never touches the user's conversation.
+        """
+        if prime_model is None:
+            prime_model = os.environ.get(PRIME_MODEL_ENV, "").lower() in ("1", "true", "yes")
+        await self._create_session()
+        if prime_model:
+            await self.chat_async(WARMUP_MESSAGE, session_id=WARMUP_SESSION_ID)
+
+    async def create_sessions(self, session_ids: Iterable[str]) -> None:
+        """Create several sessions up front, concurrently."""
+        await asyncio.gather(*[self._create_session(session_id) for session_id in session_ids])
+
+    async def _cached_reply(self, query: str, runner: Runner) -> Optional[str]:
+        """Return a cached reply for `query`, if `runner`'s replies are cached and one exists."""
+        if runner not in self._cached_runners:
+            return None
+        return await self.response_cache.get(query)
 
-    async def chat_async(self, query: str) -> str:
-        """Send a query to the coordinator agent and return the final response."""
+    async def _remember_reply(self, query: str, runner: Runner, reply: str) -> None:
+        if runner in self._cached_runners:
+            await self.response_cache.put(query, reply)
+
+    async def _run_turn(
+        self,
+        query: str,
+        runner: Runner,
+        session_id: Optional[str],
+        run_config: Optional[RunConfig] = None,
+    ) -> AsyncIterator[Event]:
+        """Send `query` through `runner` and yield the resulting events."""
+        session_id = session_id or self.session_id
         # Lazily ensure the session exists in whatever event loop we're in
-        await self._create_session()
+        await self._create_session(session_id)
         content = types.Content(role="user", parts=[types.Part(text=query)])
-        final_response_text = "Agent did not produce a final response."
 
-        async for event in self.runner.run_async(
+        events = runner.run_async(
             user_id=self.user_id,
-            session_id=self.session_id,
+            session_id=session_id,
             new_message=content,
-        ):
-            # NOTE: The next block is ONLY for debug/observability so we can see
-            # when tools (for example, the Medicaid agent's `google_search` tool)
-            # are actually being called during a conversation.
-            # Lightweight debug logging for tool usage so we can see when
-            # tools like `google_search` are invoked by any agent.
-            tool_calls = getattr(event, "tool_calls", None)
-            if tool_calls:
-                try:
-                    for call in tool_calls:
-                        # Most ADK tool call objects expose `tool_name` and `args`
-                        tool_name = getattr(call, "tool_name", "unknown_tool")
-                        args = getattr(call, "args", {})
-                        print(f"[TOOL] {tool_name} called with args: {args}")
-                except Exception:
-                    # Defensive: if the structure is different, at least log something.
-                    print(f"[TOOL] tool call event: {tool_calls}")
-
-            if event.is_final_response():
-                if event.content and event.content.parts:
-                    final_response_text = event.content.parts[0].text
-                elif event.actions and event.actions.escalate:
-                    final_response_text = (
-                        f"Agent escalated: {event.error_message or 'No specific message.'}"
-                    )
-                break
-
-        return final_response_text
+            run_config=run_config,
+        )
+        # Callers stop at the final response; close the runner's generator
+        # right away rather than leaving it to the garbage collector
+        async with aclosing(events):
+            async for event in events:
+                _log_tool_calls(event)
+                yield event
+
+    async def chat_async(self, query: str, session_id: Optional[str] = None) -> str:
+        """Send a query to the agent system and return the final response.
+
+        `session_id` defaults to the app's session; pass distinct ids to run
+        independent conversations concurrently.
+        """
+        runner = self._runner_for(query)
+        cached = await self._cached_reply(query, runner)
+        if cached is not None:
+            return cached
+
+        async with aclosing(self._run_turn(query, runner, session_id)) as events:
+            async for event in events:
+                if event.is_final_response():
+                    reply, answered = _final_reply(event)
+                    if answered:
+                        await self._remember_reply(query, runner, reply)
+                    return reply
+        return NO_FINAL_RESPONSE_TEXT
+
+    async def chat_stream(
+        self, query: str, session_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Yield the reply text incrementally as the agent generates it.
+
+        Same routing, caching, and sessions as `chat_async`, but text chunks are
+        yielded as soon as the model produces them, so callers see the first
+        token instead of waiting for the whole reply. The iterator ends once
+        the final response has been delivered.
+        """
+        runner = self._runner_for(query)
+        cached = await self._cached_reply(query, runner)
+        if cached is not None:
+            yield cached
+            return
 
-    def chat(self, query: str) -> str:
-        """Synchronous convenience wrapper around `chat_async`."""
-        return asyncio.run(self.chat_async(query))
+        streamed = False
+        run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+        async with aclosing(self._run_turn(query, runner, session_id, run_config)) as events:
+            async for event in events:
+                if event.partial:
+                    if event.content and event.content.parts:
+                        for part in event.content.parts:
+                            if part.text:
+                                streamed = True
+                                yield part.text
+                    continue
+
+                if event.is_final_response():
+                    reply, answered = _final_reply(event)
+                    # The final event repeats the aggregated partial text
+                    if not (answered and streamed):
+                        yield reply
+                    if answered:
+                        await self._remember_reply(query, runner, reply)
+                    return
+
+        yield NO_FINAL_RESPONSE_TEXT
+
+    def chat(self, query: str, session_id: Optional[str] = None) -> str:
+        """Synchronous convenience wrapper around `chat_async`.
+
+        Runs on a long-lived background event loop rather than `asyncio.run`,
+        so HTTP connection pools and other loop-bound client state survive
+        between calls. Do not call this from inside a running event loop.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.chat_async(query, session_id=session_id),
+            self._background_loop(),
+        )
+        return future.result()
+
+    @classmethod
+    def _background_loop(cls) -> asyncio.AbstractEventLoop:
+        """Return the event loop backing `chat`, starting it if needed."""
+        with cls._loop_lock:
+            if cls._loop is None:
+                loop = _new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="retirement-app-loop", daemon=True
+                )
+                thread.start()
+                cls._loop, cls._loop_thread = loop, thread
+                atexit.register(cls._stop_background_loop)
+            return cls._loop
+
+    @classmethod
+    def _stop_background_loop(cls) -> None:
+        """Stop and close the background loop (registered with `atexit`)."""
+        with cls._loop_lock:
+            loop, thread = cls._loop, cls._loop_thread
+            cls._loop, cls._loop_thread = None, None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
 
 
 # ============================================================================
@@ -181,6 +489,7 @@ async def main() -> None:
     # Initialize application (coordinator + specialist agents)
     app = RetirementResourcesApp(model=DEFAULT_MODEL)
     print(f"✅ Coordinator agent '{app.agent.name}' initialized with tools")
+    await app.warm_up()
     print(f"✅ Session: {app.app_name}/{app.user_id}/{app.session_id}\n")
 
     print("=" * 70)
@@ -223,6 +532,6 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_async(main())
     except Exception as exc:  # pragma: no cover - top-level guard
         print(f"\n❌ Fatal error: {exc}")
\ No newline at end of file
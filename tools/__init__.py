@@ -1,20 +1,28 @@
 """Tools for Florida Retirement Resources Multi-Agent System."""
 
-from .medicare_tools import get_medicare_info, search_medicare_plans
-from .medicaid_tools import get_medicaid_info, check_medicaid_eligibility
-from .local_resources_tools import (
-    get_local_resource,
-    find_healthcare_facilities,
-    find_housing_resources,
-    find_transportation_resources,
-    find_senior_centers,
-)
+import importlib
+
+# Tools are imported on first access, so `import tools` only loads the
+# modules a caller actually uses.
+_LAZY = {
+    "get_medicare_info": ".medicare_tools",
+    "search_medicare_plans": ".medicare_tools",
+    "get_medicaid_info": ".medicaid_tools",
+    "check_medicaid_eligibility": ".medicaid_tools",
+    "check_medicaid_eligibility_batch": ".medicaid_tools",
+    "get_local_resource": ".local_resources_tools",
+    "find_healthcare_facilities": ".local_resources_tools",
+    "find_housing_resources": ".local_resources_tools",
+    "find_transportation_resources": ".local_resources_tools",
+    "find_senior_centers": ".local_resources_tools",
+}
 
 __all__ = [
     "get_medicare_info",
     "search_medicare_plans",
     "get_medicaid_info",
     "check_medicaid_eligibility",
+    "check_medicaid_eligibility_batch",
     "get_local_resource",
     "find_healthcare_facilities",
     "find_housing_resources",
@@ -23,4 +31,13 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
 
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,23 @@
+"""Freezing helper for the tools' static mock databases."""
+
+import sys
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(data: Any) -> Any:
+    """Return a read-only copy of nested dict/list data.
+
+    Dicts become `MappingProxyType` views with interned string keys and lists
+    become tuples, recursively, so a tool can hand out shared module-level
+    data without a caller being able to mutate it. Named tuples are already
+    immutable records and are kept as they are.
+    """
+    if isinstance(data, dict):
+        return MappingProxyType({
+            sys.intern(key) if isinstance(key, str) else key: freeze(value)
+            for key, value in data.items()
+        })
+    if isinstance(data, list) or type(data) is tuple:
+        return tuple(freeze(item) for item in data)
+    return data
@@ -0,0 +1,30 @@
+"""Precomputed partial-match answers for the tools' topic knowledge bases."""
+
+from types import MappingProxyType
+from typing import Mapping
+
+
+def fragment_index(kb: Mapping[str, str]) -> Mapping[str, str]:
+    """Map every substring of every key to the answer a topic lookup gives for it.
+
+    Topic lookups return the exact key's entry if there is one, otherwise the
+    first entry (in key order) whose key contains the topic or is contained
+    in it. Any topic that is a fragment of some key therefore has a fixed
+    answer that can be resolved here once; callers only need to scan for
+    keys inside the topic when the topic is not in this index.
+    """
+    index = {}
+    for key in kb:
+        for start in range(len(key) + 1):
+            for end in range(start, len(key) + 1):
+                fragment = key[start:end]
+                if fragment in index:
+                    continue
+                if fragment in kb:
+                    index[fragment] = kb[fragment]
+                    continue
+                index[fragment] = next(
+                    value for candidate, value in kb.items()
+                    if candidate in fragment or fragment in candidate
+                )
+    return MappingProxyType(index)
@@ -1,8 +1,118 @@
 """Local Florida resources tools for retirees."""
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
+from ._frozen import freeze
 
+
+# Mock local resources database - in production, this would query Florida state/local databases
+_LOCAL_RESOURCES: Mapping[str, Mapping[str, Tuple[str, ...]]] = freeze({
+    "miami": {
+        "healthcare": (
+            "Jackson Memorial Hospital - Senior Services: (305) 585-1111",
+            "Miami-Dade Elder Services: (305) 671-7200",
+            "Community Health of South Florida: (305) 253-5100",
+        ),
+        "housing": (
+            "Miami-Dade Housing Authority: (305) 403-6000",
+            "Elderly Housing Development: (305) 375-4000",
+            "Section 8 Housing Vouchers: Apply at miamidade.gov/housing",
+        ),
+        "transportation": (
+            "Miami-Dade Transit Senior Discount: (305) 891-3131",
+            "Special Transportation Services (STS): (305) 891-3131",
+            "Elderly Transportation Program: Contact local senior centers",
+        ),
+        "senior center": (
+            "Miami Beach Senior Center: (305) 673-7700",
+            "Coral Gables Senior Center: (305) 460-5600",
+            "North Miami Senior Center: (305) 895-9800",
+        ),
+    },
+    "orlando": {
+        "healthcare": (
+            "Orlando Health Senior Services: (321) 841-5111",
+            "AdventHealth Senior Care: (407) 303-5600",
+            "Orange County Health Department: (407) 858-1400",
+        ),
+        "housing": (
+            "Orlando Housing Authority: (407) 895-3300",
+            "Orange County Housing Authority: (407) 895-3300",
+            "Affordable Senior Housing Directory: Contact (407) 836-6500",
+        ),
+        "transportation": (
+            "Lynx Senior Discount: (407) 841-2279",
+            "Access Lynx (Paratransit): (407) 841-2279",
+            "Senior Transportation Services: Contact local senior centers",
+        ),
+        "senior center": (
+            "Orlando Senior Center: (407) 246-4483",
+            "Winter Park Senior Center: (407) 599-3337",
+            "Kissimmee Senior Center: (407) 870-7700",
+        ),
+    },
+    "tampa": {
+        "healthcare": (
+            "Tampa General Hospital Senior Services: (813) 844-7000",
+            "BayCare Senior Care: (813) 871-2000",
+            "Hillsborough County Health Department: (813) 307-8000",
+        ),
+        "housing": (
+            "Tampa Housing Authority: (813) 253-0551",
+            "Hillsborough County Housing Authority: (813) 672-5400",
+            "Senior Housing Resources: (813) 272-5040",
+        ),
+        "transportation": (
+            "HART Senior Discount: (813) 254-4278",
+            "HART Plus (Paratransit): (813) 254-4278",
+            "Senior Transportation Network: Contact (813) 272-5040",
+        ),
+        "senior center": (
+            "Tampa Senior Center: (813) 274-8181",
+            "Hyde Park Senior Center: (813) 251-2177",
+            "North Tampa Senior Center: (813) 975-2121",
+        ),
+    },
+})
+
+
+# Not-found hints list what the database actually holds
+_CITIES_HINT = (
+    f"Available cities: {', '.join(city.title() for city in _LOCAL_RESOURCES)}. "
+    "For resources in other areas, contact your local Area Agency on Aging: 1-800-963-5337"
+)
+_RESOURCE_TYPES_HINT = (
+    "Available resource types: "
+    f"{', '.join(dict.fromkeys(t for by_type in _LOCAL_RESOURCES.values() for t in by_type))}. "
+    "Contact local Area Agency on Aging for more information: 1-800-963-5337"
+)
+
+_FOOTER = (
+    "For additional resources, contact:\n"
+    "- Florida Department of Elder Affairs: elderaffairs.org\n"
+    "- Area Agency on Aging: 1-800-963-5337\n"
+    "- Local ADRC (Aging and Disability Resource Center)"
+)
+
+
+def _render(city: str, resource_type: str, resources: Tuple[str, ...]) -> str:
+    """Render everything in a resource listing that precedes the zip code."""
+    body = "\n".join(f"{i}. {resource}" for i, resource in enumerate(resources, 1))
+    return f"{resource_type.title()} Resources in {city.title()}:\n\n{body}\n\nZip code provided: "
+
+
+# Listings are static apart from the zip code, so each (city, resource type)
+# answer is rendered once at import and the zip code is appended per call.
+_RENDERED: Mapping[Tuple[str, str], str] = MappingProxyType({
+    (city, resource_type): _render(city, resource_type, resources)
+    for city, by_type in _LOCAL_RESOURCES.items()
+    for resource_type, resources in by_type.items()
+})
+
+
+@lru_cache(maxsize=256)
 def get_local_resource(resource_type: str, city: str, zip_code: Optional[str] = None) -> str:
     """Get information about local Florida resources for retirees.
     
@@ -15,106 +125,17 @@ def get_local_resource(resource_type: str, city: str, zip_code: Optional[str] =
     Returns:
         Information about local resources
     """
-    # Mock local resources database - in production, this would query Florida state/local databases
-    local_resources: Dict[str, Dict[str, List[str]]] = {
-        "miami": {
-            "healthcare": [
-                "Jackson Memorial Hospital - Senior Services: (305) 585-1111",
-                "Miami-Dade Elder Services: (305) 671-7200",
-                "Community Health of South Florida: (305) 253-5100",
-            ],
-            "housing": [
-                "Miami-Dade Housing Authority: (305) 403-6000",
-                "Elderly Housing Development: (305) 375-4000",
-                "Section 8 Housing Vouchers: Apply at miamidade.gov/housing",
-            ],
-            "transportation": [
-                "Miami-Dade Transit Senior Discount: (305) 891-3131",
-                "Special Transportation Services (STS): (305) 891-3131",
-                "Elderly Transportation Program: Contact local senior centers",
-            ],
-            "senior center": [
-                "Miami Beach Senior Center: (305) 673-7700",
-                "Coral Gables Senior Center: (305) 460-5600",
-                "North Miami Senior Center: (305) 895-9800",
-            ],
-        },
-        "orlando": {
-            "healthcare": [
-                "Orlando Health Senior Services: (321) 841-5111",
-                "AdventHealth Senior Care: (407) 303-5600",
-                "Orange County Health Department: (407) 858-1400",
-            ],
-            "housing": [
-                "Orlando Housing Authority: (407) 895-3300",
-                "Orange County Housing Authority: (407) 895-3300",
-                "Affordable Senior Housing Directory: Contact (407) 836-6500",
-            ],
-            "transportation": [
-                "Lynx Senior Discount: (407) 841-2279",
-                "Access Lynx (Paratransit): (407) 841-2279",
-                "Senior Transportation Services: Contact local senior centers",
-            ],
-            "senior center": [
-                "Orlando Senior Center: (407) 246-4483",
-                "Winter Park Senior Center: (407) 599-3337",
-                "Kissimmee Senior Center: (407) 870-7700",
-            ],
-        },
-        "tampa": {
-            "healthcare": [
-                "Tampa General Hospital Senior Services: (813) 844-7000",
-                "BayCare Senior Care: (813) 871-2000",
-                "Hillsborough County Health Department: (813) 307-8000",
-            ],
-            "housing": [
-                "Tampa Housing Authority: (813) 253-0551",
-                "Hillsborough County Housing Authority: (813) 672-5400",
-                "Senior Housing Resources: (813) 272-5040",
-            ],
-            "transportation": [
-                "HART Senior Discount: (813) 254-4278",
-                "HART Plus (Paratransit): (813) 254-4278",
-                "Senior Transportation Network: Contact (813) 272-5040",
-            ],
-            "senior center": [
-                "Tampa Senior Center: (813) 274-8181",
-                "Hyde Park Senior Center: (813) 251-2177",
-                "North Tampa Senior Center: (813) 975-2121",
-            ],
-        },
-    }
-    
     city_lower = city.lower().strip()
     resource_lower = resource_type.lower().strip()
     
-    if city_lower not in local_resources:
-        return (
-            f"Resources for {city} not found in database. "
-            "Available cities: Miami, Orlando, Tampa. "
-            "For resources in other areas, contact your local Area Agency on Aging: 1-800-963-5337"
-        )
-    
-    if resource_lower not in local_resources[city_lower]:
-        return (
-            f"{resource_type} resources not found for {city}. "
-            "Available resource types: healthcare, housing, transportation, senior center. "
-            "Contact local Area Agency on Aging for more information: 1-800-963-5337"
-        )
-    
-    resources = local_resources[city_lower][resource_lower]
-    
-    result = f"{resource_type.title()} Resources in {city.title()}:\n\n"
-    for i, resource in enumerate(resources, 1):
-        result += f"{i}. {resource}\n"
-    
-    result += f"\nZip code provided: {zip_code if zip_code else 'Not specified'}\n"
-    result += "\nFor additional resources, contact:\n"
-    result += "- Florida Department of Elder Affairs: elderaffairs.org\n"
-    result += "- Area Agency on Aging: 1-800-963-5337\n"
-    result += "- Local ADRC (Aging and Disability Resource Center)"
+    prefix = _RENDERED.get((city_lower, resource_lower))
+    if prefix is not None:
+        return f"{prefix}{zip_code if zip_code else 'Not specified'}\n\n{_FOOTER}"
     
-    return result
+    # Work out which half of the lookup failed only on the miss path
+    if city_lower not in _LOCAL_RESOURCES:
+        return f"Resources for {city} not found in database. {_CITIES_HINT}"
+    return f"{resource_type} resources not found for {city}. {_RESOURCE_TYPES_HINT}"
 
 
 def find_healthcare_facilities(city: str, facility_type: str = "all") -> str: